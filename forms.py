@@ -1,16 +1,112 @@
 """Module for Tkinter UI forms."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, get_args
 import tkinter as tk
-from tkinter import filedialog, colorchooser
-import ast
+from tkinter import ttk
+import builtins
 import enum
-from http import client as httpclient
+import functools
 import logging
 import json
+import queue
+import threading
+import types
+
+# Only needed once a dialog is opened, a RUN_CODE snippet is compiled or an HTTP
+# request is sent, so they are imported where they are used (orjson included)
+if TYPE_CHECKING:
+    import ast
+    from http import client as httpclient
 
 __all__ = ["Form"]
 
+# Pack options shared by the form element widgets
+_PACK_X = {"fill": tk.X, "padx": 5, "pady": 5}
+_PACK_BOTH = {"fill": tk.BOTH, "expand": True, "padx": 5, "pady": 5}
+
+# How often the Tk thread checks for finished background submissions
+_POLL_INTERVAL_MS = 10
+
+# What an HTTP submission returns: nothing, the status code, or the response body
+ResponseMode = Literal["none", "status", "body"]
+_RESPONSE_MODES = frozenset(get_args(ResponseMode))
+# Requests that are safe to send twice, so they may be retried after the
+# server has possibly already received them
+_IDEMPOTENT_VERBS = frozenset({"PUT", "DELETE"})
+# Size of the reads used to drain unwanted response bodies
+_DRAIN_CHUNK_SIZE = 64 * 1024
+
+
+# Names a RUN_CODE snippet may not reference
+_BANNED_NAMES = frozenset(
+    {"exec", "eval", "__import__", "compile", "globals", "locals"}
+)
+
+
+# Builtins withheld from RUN_CODE snippets on top of the banned names
+_WITHHELD_BUILTINS = _BANNED_NAMES | {
+    "open",
+    "input",
+    "breakpoint",
+    "getattr",
+    "setattr",
+    "delattr",
+    "vars",
+}
+# Builtins exposed to RUN_CODE snippets, built once at import;
+# class statements need __build_class__ and look up __name__
+_SAFE_BUILTINS = {
+    name: value
+    for name, value in vars(builtins).items()
+    if name not in _WITHHELD_BUILTINS
+    and (not name.startswith("_") or name in {"__build_class__", "__name__"})
+}
+
+
+def _validate_code(tree: "ast.AST"):
+    """Reject RUN_CODE snippets that import modules or reach for banned names."""
+    import ast
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            raise ValueError("The provided code may not import modules.")
+        if isinstance(node, ast.Name) and node.id in _BANNED_NAMES:
+            raise ValueError(f"The provided code may not use '{node.id}'.")
+        if isinstance(node, ast.Attribute) and node.attr.startswith("__"):
+            raise ValueError(f"The provided code may not access '{node.attr}'.")
+
+
+@functools.cache
+def _load_orjson() -> types.ModuleType | None:
+    """Import orjson on first use, or return None when it isn't installed."""
+    try:
+        import orjson
+    except ImportError:  # orjson is optional; fall back to the stdlib encoder
+        return None
+    return orjson
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed.
+    Data orjson rejects, such as integers beyond 64 bits, goes through json instead.
+    Unlike json, orjson sends NaN and infinity as null.
+    """
+    orjson = _load_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def _in_choice_set(value: Any, choice_set: set[str]) -> bool:
+    """Check membership in a choice set; unhashable values are never choices."""
+    try:
+        return value in choice_set
+    except TypeError:
+        return False
+
 
 class SubmitMode(enum.Enum):
     """Enum for form submission modes."""
@@ -26,114 +122,257 @@ class SubmitMode(enum.Enum):
 class Form(tk.Frame):
     """Class representing a form in the Tkinter UI."""
 
+    # HTTP submission modes and the request method each one sends
+    _HTTP_VERBS = {
+        SubmitMode.HTTP_POST: "POST",
+        SubmitMode.HTTP_PUT: "PUT",
+        SubmitMode.HTTP_DELETE: "DELETE",
+        SubmitMode.HTTP_PATCH: "PATCH",
+    }
+
     def __init__(self, master: tk.Misc):
         super().__init__(master)
         self.master = master
-        self._elements = []
+        # Named elements in the order they were added
+        self._elements: dict[str, "FormElement"] = {}
+        # Idle kept-alive HTTP connections per host, reused across submissions;
+        # a request checks one out and returns it when done
+        self._connections: dict[str, list["httpclient.HTTPConnection"]] = {}
+        # Guards the pool only, never held while a request is in flight
+        self._http_lock = threading.Lock()
+        # Bumped by close(), so connections checked out earlier aren't pooled again
+        self._http_generation = 0
+        # Background submissions: (callback, result, error) tuples from workers
+        self._finished: queue.SimpleQueue = queue.SimpleQueue()
+        self._outstanding = 0
+        self._polling = False
+        # Validated, compiled RUN_CODE snippets keyed by their source
+        self._code_cache: dict[str, types.CodeType] = {}
 
     def add_element(self, element: "FormElement"):
         """Add a form element to the form."""
-        self._elements.append(element)
-    
+        if not isinstance(element, FormElement):
+            raise TypeError(f"Expected a FormElement, got {type(element).__name__}.")
+        name = element.name
+        # Unnamed elements never contribute a value, so there is nothing to track
+        if not name:
+            logging.debug("TKUI: Ignoring unnamed element: %s", type(element).__name__)
+            return
+        if name in self._elements:
+            raise ValueError(f"An element named {name!r} is already in the form.")
+        self._elements[name] = element
+
     def add_elements(self, *elements: "FormElement"):
         """Add multiple form elements to the form."""
         for element in elements:
             self.add_element(element)
 
+    def get_element(self, name: str) -> "FormElement":
+        """Get the form element with the given name."""
+        try:
+            return self._elements[name]
+        except KeyError:
+            raise KeyError(f"No element named {name!r} in the form.") from None
+
     def process_form(self) -> dict[str, Any]:
         """Process the form and return a dictionary of element names and values."""
         results = {}
-        for element in self._elements:
-            print(
-                f"Processing element: {element.name if hasattr(element, 'name') else element.__class__.__name__}"
-            )
-            # Check if the element has a name and value before adding
-            if isinstance(element, FormElement) and element.name:
-                try:
-                    results[element.name] = element.value
-                except AttributeError as e:
-                    logging.error(f"TKUI: Error getting value for {element.name}: {e}")
+        for name, element in self._elements.items():
+            logging.debug("TKUI: Processing element: %s", name)
+            try:
+                results[name] = element.value
+            except AttributeError as e:
+                logging.error(f"TKUI: Error getting value for {name}: {e}")
         return results
 
+    def _http_request(
+        self,
+        method: str,
+        host: str,
+        data: dict[str, Any],
+        response: ResponseMode = "body",
+    ) -> bytes | int | None:
+        """Send the form data to host, reusing an idle connection from earlier requests.
+        Requests on different connections run concurrently.
+        """
+        try:
+            body = _json_bytes(data)
+        except (TypeError, ValueError) as e:
+            raise RuntimeError(f"Error occurred during HTTP {method}: {e}") from e
+        with self._http_lock:
+            idle = self._connections.get(host)
+            conn = idle.pop() if idle else None
+            generation = self._http_generation
+        reused = conn is not None
+        if conn is None:
+            from http import client as httpclient
+
+            conn = httpclient.HTTPConnection(host=host)
+        headers = {"Content-Type": "application/json"}
+        try:
+            sent = False
+            try:
+                conn.request(method, "/", body=body, headers=headers)
+                sent = True
+                http_response = conn.getresponse()
+            except ConnectionError:
+                # Once the request is sent the server may have acted on it, so
+                # only idempotent requests are sent again
+                if not reused or (sent and method not in _IDEMPOTENT_VERBS):
+                    raise
+                # The server dropped the idle connection; retry once on a fresh one
+                conn.close()
+                conn.request(method, "/", body=body, headers=headers)
+                http_response = conn.getresponse()
+            if response == "body":
+                result = http_response.read()
+            else:
+                # The body still has to be consumed before the connection can be
+                # reused, but it is discarded chunk by chunk rather than kept whole
+                while http_response.read(_DRAIN_CHUNK_SIZE):
+                    pass
+                result = http_response.status if response == "status" else None
+        except Exception as e:
+            conn.close()
+            raise RuntimeError(f"Error occurred during HTTP {method}: {e}") from e
+        with self._http_lock:
+            if generation == self._http_generation:
+                self._connections.setdefault(host, []).append(conn)
+                return result
+        # close() ran while this request was in flight
+        conn.close()
+        return result
+
+    def close(self):
+        """Close the idle HTTP connections kept open by earlier submissions.
+        Connections in use by a running request are closed when it finishes.
+        """
+        with self._http_lock:
+            self._http_generation += 1
+            idle = [conn for conns in self._connections.values() for conn in conns]
+            self._connections.clear()
+        for conn in idle:
+            conn.close()
+
+    def destroy(self):
+        """Close any open HTTP connections, then destroy the form."""
+        self.close()
+        super().destroy()
+
     def submit(
-        self, mode: SubmitMode = SubmitMode.HTTP_POST, url_file_code: str | None = None
+        self,
+        mode: SubmitMode = SubmitMode.HTTP_POST,
+        url_file_code: str | None = None,
+        response: ResponseMode = "body",
+    ):
+        """Submit the form data based on the specified mode.
+        For HTTP modes, response selects what is returned: the body bytes ("body"),
+        the status code ("status") or nothing ("none").
+        """
+        return self._submit_data(mode, url_file_code, self.process_form(), response)
+
+    def submit_async(
+        self,
+        mode: SubmitMode = SubmitMode.HTTP_POST,
+        url_file_code: str | None = None,
+        callback: Callable[[Any, Exception | None], None] | None = None,
+        response: ResponseMode = "body",
     ):
-        """Submit the form data based on the specified mode."""
+        """Submit the form data without blocking the Tk event loop.
+        HTTP requests run on a worker thread; callback(result, error) is then called
+        on the Tk thread. Other modes run immediately, as with submit.
+        """
+        # Element values are read here, on the Tk thread
         data = self.process_form()
+        if mode not in self._HTTP_VERBS:
+            try:
+                result = self._submit_data(mode, url_file_code, data, response)
+            except Exception as e:
+                if callback is None:
+                    raise
+                callback(None, e)
+            else:
+                if callback is not None:
+                    callback(result, None)
+            return
+
+        def worker():
+            try:
+                result = self._submit_data(mode, url_file_code, data, response)
+                outcome = (callback, result, None)
+            except Exception as e:
+                outcome = (callback, None, e)
+            self._finished.put(outcome)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self._outstanding += 1
+        if not self._polling:
+            self._polling = True
+            self.after(_POLL_INTERVAL_MS, self._poll_submissions)
+
+    def _poll_submissions(self):
+        """Pass finished background submissions to their callbacks on the Tk thread."""
+        try:
+            while True:
+                try:
+                    callback, result, error = self._finished.get_nowait()
+                except queue.Empty:
+                    break
+                self._outstanding -= 1
+                if callback is not None:
+                    callback(result, error)
+                elif error is not None:
+                    logging.error("TKUI: Background submission failed: %s", error)
+        finally:
+            # Keep polling even if a callback raised
+            if self._outstanding:
+                self.after(_POLL_INTERVAL_MS, self._poll_submissions)
+            else:
+                self._polling = False
+
+    def _compile_code(self, source: str) -> types.CodeType:
+        """Validate and compile a RUN_CODE snippet, reusing earlier compilations."""
+        code = self._code_cache.get(source)
+        if code is None:
+            import ast
+
+            try:
+                tree = ast.parse(source, mode="exec")
+            except SyntaxError as e:
+                raise RuntimeError(f"Error occurred while running code: {e}") from e
+            _validate_code(tree)
+            code = self._code_cache[source] = compile(tree, "<form>", "exec")
+        return code
+
+    def _submit_data(
+        self,
+        mode: SubmitMode,
+        url_file_code: str | None,
+        data: dict[str, Any],
+        response: ResponseMode = "body",
+    ):
+        """Submit already processed form data based on the specified mode."""
         if not url_file_code and mode != SubmitMode.LOG:
             raise ValueError("url_file_code must be provided for non-log submission.")
+        if mode in self._HTTP_VERBS:
+            if response not in _RESPONSE_MODES:
+                raise ValueError(f"Unknown response mode: {response!r}")
+            verb = self._HTTP_VERBS[mode]
+            return self._http_request(verb, url_file_code, data, response)
         match mode:
-            case SubmitMode.HTTP_POST:
-                if not url_file_code:
-                    raise ValueError(
-                        "url_file_code must be provided for non-log submission."
-                    )
-                conn = httpclient.HTTPConnection(host=url_file_code)
-                try:
-                    conn.request("POST", "/", body=json.dumps(data))
-                    response = conn.getresponse()
-                    return response.read()
-                except Exception as e:
-                    raise RuntimeError(f"Error occurred during HTTP POST: {e}") from e
-                finally:
-                    conn.close()
-            case SubmitMode.HTTP_PUT:
-                if not url_file_code:
-                    raise ValueError(
-                        "url_file_code must be provided for non-log submission."
-                    )
-                conn = httpclient.HTTPConnection(host=url_file_code)
-                try:
-                    conn.request("PUT", "/", body=json.dumps(data))
-                    response = conn.getresponse()
-                    return response.read()
-                except Exception as e:
-                    raise RuntimeError(f"Error occurred during HTTP PUT: {e}") from e
-                finally:
-                    conn.close()
-            case SubmitMode.HTTP_DELETE:
-                if not url_file_code:
-                    raise ValueError(
-                        "url_file_code must be provided for non-log submission."
-                    )
-                conn = httpclient.HTTPConnection(host=url_file_code)
-                try:
-                    conn.request("DELETE", "/", body=json.dumps(data))
-                    response = conn.getresponse()
-                    return response.read()
-                except Exception as e:
-                    raise RuntimeError(f"Error occurred during HTTP DELETE: {e}") from e
-                finally:
-                    conn.close()
-            case SubmitMode.HTTP_PATCH:
-                if not url_file_code:
-                    raise ValueError(
-                        "url_file_code must be provided for non-log submission."
-                    )
-                conn = httpclient.HTTPConnection(host=url_file_code)
-                try:
-                    conn.request("PATCH", "/", body=json.dumps(data))
-                    response = conn.getresponse()
-                    return response.read()
-                except Exception as e:
-                    raise RuntimeError(f"Error occurred during HTTP PATCH: {e}") from e
-                finally:
-                    conn.close()
             case SubmitMode.RUN_CODE:
-                if not url_file_code:
-                    raise ValueError(
-                        "url_file_code must be provided for non-log submission."
-                    )
+                code = self._compile_code(url_file_code)
+                # A fresh namespace per run, with its own copy of the builtins table:
+                # functions the snippet returns keep theirs, and nothing it changes
+                # leaks into the next submission. The form data goes in as globals,
+                # but can't replace the restricted builtins
                 globals_dict = {
                     "data": data,
+                    **data,
+                    "__builtins__": dict(_SAFE_BUILTINS),
                 }
-                globals_dict.update(data)  # Add form data to globals
-                # ban_regex: str = (
-                #     r"(?i)import|from|exec|eval|__import__|globals|locals|locals\(\)|globals\(\)|compile"  # if re.search(ban_regex, url_file_code) is not None:
-                # )
-                #     raise ValueError("The provided code contains banned keywords.")
                 try:
-                    exec(url_file_code, globals_dict)
+                    exec(code, globals_dict)
                     return globals_dict.get("result", None)
                 except Exception as e:
                     raise RuntimeError(f"Error occurred while running code: {e}") from e
@@ -144,196 +383,254 @@ class Form(tk.Frame):
 class FormElement(tk.Frame):
     """Base class for an element in the form."""
 
+    # tk.Frame still carries a __dict__ for Tk's own attributes (master, tk,
+    # children); the slots keep our per-element state off it
+    __slots__ = ("name", "_built", "_traces")
+
+    # Subclasses with a variable declare it as a slot and set it before
+    # calling FormElement.__init__
     _var: tk.Variable | None = None
+    # Stored in the variable when None is assigned to value
+    _empty_value: Any = None
 
     def __init__(self, master: tk.Misc, name: str, default: Any | None = None):
         super().__init__(master)
         self.master = master
         self.name = name
+        self._built = False
+        # Write traces on the variable, removed again when the element is destroyed
+        self._traces: list[str] = []
+
+    def _trace_write(self, callback: Callable[..., Any]):
+        """Register a write trace on the variable, once per element."""
+        if self._var is not None:
+            self._traces.append(self._var.trace_add("write", callback))
+
+    def destroy(self):
+        """Remove the variable traces, then destroy the element."""
+        if self._var is not None:
+            for trace_id in self._traces:
+                self._var.trace_remove("write", trace_id)
+        self._traces.clear()
+        super().destroy()
 
     def regen_widgets(self):
         """Regenerate the widgets of the form element.
-        WARNING: This method should clear all children of the element.
+        The widgets are built on the first call and refreshed in place afterwards.
         """
+        if not self._built:
+            self._build_widgets()
+            self._built = True
+        else:
+            self._refresh_widgets()
+
+    def _build_widgets(self):
+        """Build the child widgets of the form element. Called once."""
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def _refresh_widgets(self):
+        """Update the existing child widgets to match the element's state."""
+
     @property
     def value(self):
         """Get the value of the form element."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        # Ensure _var is a valid Tkinter variable before calling .get()
-        return self._var.get() if hasattr(self, "_var") else None
+        return self._var.get()
 
     @value.setter
     def value(self, new_value: Any):
         """Set the value of the form element."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        if hasattr(self, "_var") and self._var is not None:
-            self._var.set(new_value)
-        else:
-            raise AttributeError("This form element does not have a variable to set.")
+        self._var.set(self._coerce(new_value))
 
+    def _coerce(self, value: Any) -> Any:
+        """Convert a value assigned to the element into what its variable stores."""
+        return value if value is not None else self._empty_value
 
-class StringForm(FormElement):
-    """Class for a string input form element."""
 
-    def __init__(self, master: tk.Misc, name: str, default: str | None = None):
+class _EntryFormElement(FormElement):
+    """Base class for form elements edited through a single Entry."""
+
+    __slots__ = ("_var", "entry")
+
+    _var_cls: type[tk.Variable] = tk.StringVar
+    _empty_value: Any = ""
+
+    def __init__(self, master: tk.Misc, name: str, default: Any | None = None):
         # Initialize the variable before calling super().__init__
-        self._var = tk.StringVar(value=default if default is not None else "")
+        self._var = self._var_cls(value=self._coerce(default))
         super().__init__(master, name, default)
         self.regen_widgets()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the string input."""
-        for widget in self.winfo_children():
-            widget.destroy()
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
+    def _build_widgets(self):
+        """Build the entry for the input."""
         self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
+        self.entry.pack(**_PACK_X)
+
+
+class StringForm(_EntryFormElement):
+    """Class for a string input form element."""
 
+    __slots__ = ()
 
-class IntForm(FormElement):
+
+class IntForm(_EntryFormElement):
     """Class for an integer input form element."""
 
-    def __init__(self, master: tk.Misc, name: str, default: int | None = None):
-        # Initialize the variable before calling super().__init__
-        self._var = tk.IntVar(value=default if default is not None else 0)
-        super().__init__(master, name, default)
-        self.regen_widgets()
+    __slots__ = ()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the integer input."""
-        for widget in self.winfo_children():
-            widget.destroy()
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
+    _var_cls = tk.IntVar
+    _empty_value = 0
 
 
-class FloatForm(FormElement):
+class FloatForm(_EntryFormElement):
     """Class for a float input form element."""
 
-    def __init__(self, master: tk.Misc, name: str, default: float | None = None):
-        # Initialize the variable before calling super().__init__
-        self._var = tk.DoubleVar(value=default if default is not None else 0.0)
-        super().__init__(master, name, default)
-        self.regen_widgets()
+    __slots__ = ()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the float input."""
-        for widget in self.winfo_children():
-            widget.destroy()
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
+    _var_cls = tk.DoubleVar
+    _empty_value = 0.0
 
 
 class BoolForm(FormElement):
     """Class for a boolean input form element."""
 
+    __slots__ = ("_var", "checkbutton")
+
+    _empty_value = False
+
     def __init__(self, master: tk.Misc, name: str, default: bool | None = None):
         # Initialize the variable before calling super().__init__
-        self._var = tk.BooleanVar(value=default if default is not None else False)
+        self._var = tk.BooleanVar(value=self._coerce(default))
         super().__init__(master, name, default)
         self.regen_widgets()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the boolean input."""
-        for widget in self.winfo_children():
-            widget.destroy()
+    def _build_widgets(self):
+        """Build the widgets for the boolean input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
         self.checkbutton = tk.Checkbutton(self, variable=self._var)
-        self.checkbutton.pack(fill=tk.X, padx=5, pady=5)
+        self.checkbutton.pack(**_PACK_X)
 
 
-class ListForm(FormElement):
+class ListForm(_EntryFormElement):
     """Class for a list input form element."""
 
+    __slots__ = ("_items", "_text")
+
     def __init__(self, master: tk.Misc, name: str, default: list | None = None):
-        # Initialize the variable before calling super().__init__
-        value = ",".join(map(str, default)) if default is not None else ""
-        self._var = tk.StringVar(value=value)
+        # The list is the source of truth; the variable only mirrors it for display
+        self._items: list[str] = self._to_items(default)
+        self._text = ",".join(self._items)
         super().__init__(master, name, default)
-        self.regen_widgets()
+        self._trace_write(self._sync_from_var)
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the list input."""
-        for widget in self.winfo_children():
-            widget.destroy()
+    @staticmethod
+    def _to_items(value: list | None) -> list[str]:
+        """Convert the items to strings, as they read back after an edit."""
+        if value is None:
+            return []
+        texts = [str(item) for item in value]
+        # An item containing the separator would come back as several items
+        for text in texts:
+            if "," in text:
+                raise ValueError(f"List items cannot contain ',': {text!r}")
+        return texts
+
+    def _coerce(self, value: list | None) -> str:
+        """Join the items into the comma-separated text shown in the entry."""
+        return ",".join(self._to_items(value))
+
+    def _sync_from_var(self, *_):
+        """Re-split the entry text into items after the user edits it."""
         if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
+            return
+        text = self._var.get()
+        if text == self._text:
+            return
+        self._text = text
+        self._items = text.split(",") if text else []
 
     @property
     def value(self):
         """Get the list value of the form element."""
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        # Safely split the string value
-        return self._var.get().split(",") if self._var.get() else []
+        return list(self._items)
 
     @value.setter
     def value(self, new_value: list | None):
         """Set the list value of the form element."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        # Handle new_value=None by setting the variable to an empty string
-        if new_value is not None:
-            self._var.set(",".join(map(str, new_value)))
-        else:
-            self._var.set("")
+        # Handle new_value=None by clearing the list; convert first, so a rejected
+        # list leaves the element unchanged
+        items = self._to_items(new_value)
+        text = ",".join(items)
+        self._items = items
+        self._text = text
+        self._var.set(text)
 
 
-class DictForm(FormElement):
-    """Class for a dictionary input form element."""
+class DictForm(_EntryFormElement):
+    """Class for a dictionary input form element.
+    The dictionary is shown as JSON, so non-string keys come back as strings.
+    """
 
-    def __init__(self, master: tk.Misc, name: str, default: dict | None = None):
-        # Initialize the variable before calling super().__init__
-        self._var = tk.StringVar(value=str(default) if default is not None else "{}")
-        super().__init__(master, name, default)
-        self.regen_widgets()
+    __slots__ = ()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the dictionary input."""
-        for widget in self.winfo_children():
-            widget.destroy()
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
-
-    @property
+    @_EntryFormElement.value.getter
     def value(self):
         """Get the dictionary value of the form element."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        # Use ast.literal_eval for safe evaluation of the string as a dict
+        text = self._var.get()
+        # Parsed on every read, so each caller gets a dict of its own
+        try:
+            return json.loads(text)
+        except ValueError:
+            # Not JSON; accept a Python literal such as {'a': 1} instead
+            import ast
+
+            try:
+                return ast.literal_eval(text)
+            except (ValueError, SyntaxError):
+                return {}
+
+    def _coerce(self, value: dict | None) -> str:
+        """Serialize a dictionary for the entry, as JSON where possible."""
+        if value is None:
+            return "{}"
         try:
-            return ast.literal_eval(self._var.get())
-        except (ValueError, SyntaxError):
-            return {}
+            return json.dumps(value)
+        except TypeError:
+            # Keys or values JSON can't represent; fall back to a Python literal
+            return str(value)
 
-    @value.setter
-    def value(self, new_value: dict | None):
-        """Set the dictionary value of the form element."""
+
+class _ChoiceFormElement(FormElement):
+    """Base class for form elements that pick from a list of choices."""
+
+    __slots__ = ("choices", "_choice_set")
+
+    def extend_choices(self, choices: Iterable[str]):
+        """Add several new choices at once, updating the widgets a single time.
+        Choices that already exist are skipped. Use add_choice for single-item updates.
+        """
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        if new_value is not None:
-            self._var.set(str(new_value))
-        else:
-            self._var.set("{}")
+        for choice in choices:
+            if choice not in self._choice_set:
+                self._choice_set.add(choice)
+                self.choices.append(choice)
+        self.regen_widgets()
 
 
-class ChoiceForm(FormElement):
+class ChoiceForm(_ChoiceFormElement):
     """Class for a choice input form element."""
 
+    __slots__ = ("_var", "combobox")
+
     def __init__(
         self, master: tk.Misc, name: str, choices: list[str], default: str | None = None
     ):
@@ -343,37 +640,35 @@ class ChoiceForm(FormElement):
         value = default if default in choices else choices[0]
         self._var = tk.StringVar(value=value)
         self.choices = choices
+        # Mirror of self.choices for O(1) membership checks
+        self._choice_set: set[str] = set(choices)
         super().__init__(master, name, default)
         self.regen_widgets()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the choice input."""
-        for widget in self.winfo_children():
-            widget.destroy()
+    def _build_widgets(self):
+        """Build the widgets for the choice input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        # Ensure choices is a non-empty list
-        if not self.choices:
-            return
         if not isinstance(self._var, tk.StringVar):
             raise TypeError("Variable must be a StringVar.")
-        self.option_menu = tk.OptionMenu(self, self._var, *self.choices)
-        self.option_menu.pack(fill=tk.X, padx=5, pady=5)
-
-    @property
-    def value(self):
-        """Get the selected choice value."""
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        return self._var.get()
-
-    @value.setter
+        # The whole choice list goes to Tk in one call, not one menu entry per choice
+        self.combobox = ttk.Combobox(
+            self, textvariable=self._var, values=self.choices, state="readonly"
+        )
+        self.combobox.pack(**_PACK_X)
+
+    def _refresh_widgets(self):
+        """Sync the combobox values with the current choices."""
+        self._choice_set = set(self.choices)
+        self.combobox.configure(values=self.choices)
+
+    @FormElement.value.setter
     def value(self, new_value: str | None):
         """Set the selected choice value."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
         # Handle new_value=None by setting to the first choice
-        if new_value in self.choices:
+        if _in_choice_set(new_value, self._choice_set):
             self._var.set(new_value)
         elif new_value is None and self.choices:
             self._var.set(self.choices[0])
@@ -384,9 +679,10 @@ class ChoiceForm(FormElement):
         """Add a new choice to the choice input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        if choice not in self.choices:
+        if choice not in self._choice_set:
+            self._choice_set.add(choice)
             self.choices.append(choice)
-            self.regen_widgets()
+            self.combobox.configure(values=self.choices)
         else:
             raise ValueError(f"Choice '{choice}' already exists.")
 
@@ -394,13 +690,14 @@ class ChoiceForm(FormElement):
         """Remove a choice from the choice input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        if choice in self.choices:
+        if _in_choice_set(choice, self._choice_set):
+            self._choice_set.discard(choice)
             self.choices.remove(choice)
+            self.combobox.configure(values=self.choices)
             if self.choices and self._var.get() == choice:
                 self._var.set(self.choices[0])
             elif not self.choices:
                 self._var.set("")
-            self.regen_widgets()
         else:
             raise ValueError(f"Choice '{choice}' does not exist.")
 
@@ -409,13 +706,16 @@ class ChoiceForm(FormElement):
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
         self.choices.clear()
+        self._choice_set.clear()
+        self.combobox.configure(values=self.choices)
         self._var.set("")
-        self.regen_widgets()
 
 
-class MultiChoiceForm(FormElement):
+class MultiChoiceForm(_ChoiceFormElement):
     """Class for a multi-choice input form element."""
 
+    __slots__ = ("_var", "listbox", "_listbox_choices", "_pending")
+
     def __init__(
         self,
         master: tk.Misc,
@@ -426,36 +726,73 @@ class MultiChoiceForm(FormElement):
         # Initialize the variable before calling super().__init__
         value = ",".join(map(str, default)) if default is not None else ""
         self._var = tk.StringVar(value=value)
-        self.choices = choices
+        self.choices = choices if choices is not None else []
+        # Mirror of self.choices for O(1) membership checks
+        self._choice_set: set[str] = set(self.choices)
+        # Idle callback that will copy the selection into the variable, if scheduled
+        self._pending: str | None = None
         super().__init__(master, name, default)
         self.regen_widgets()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the multi-choice input."""
-        for widget in self.winfo_children():
-            widget.destroy()
-        if self.choices is None:
-            return
+    def _build_widgets(self):
+        """Build the widgets for the multi-choice input."""
         self.listbox = tk.Listbox(self, selectmode=tk.MULTIPLE)
-        for choice in self.choices:
-            self.listbox.insert(tk.END, choice)
-        self.listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # One insert call carrying every item, not one Tcl command per item
+        self.listbox.insert(tk.END, *self.choices)
+        self.listbox.pack(**_PACK_BOTH)
         # Bind the selection event
         self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        # Items currently in the listbox, kept in step with self.choices
+        self._listbox_choices = list(self.choices)
+
+    def _refresh_widgets(self):
+        """Sync the listbox items with the current choices, keeping the selection."""
+        if not hasattr(self, "listbox") or self._listbox_choices == self.choices:
+            return
+        self._choice_set = set(self.choices)
+        count = len(self._listbox_choices)
+        if self.choices[:count] == self._listbox_choices:
+            # Choices were only appended; the selection is unaffected
+            self.listbox.insert(tk.END, *self.choices[count:])
+            self._listbox_choices = list(self.choices)
+            return
+        selected = self.value
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *self.choices)
+        self._listbox_choices = list(self.choices)
+        self.value = selected
 
     def _on_select(self, _):
-        """Handle selection changes in the listbox."""
+        """Handle selection changes in the listbox.
+        Bursts of events, such as a drag selection, are coalesced into one update.
+        """
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        selected = self.value
-        self._var.set(",".join(selected))
+        # value reads the listbox itself, so it is current even before this runs
+        if self._pending is None:
+            self._pending = self.after_idle(self._flush_selection)
+
+    def _flush_selection(self):
+        """Copy the listbox selection into the variable."""
+        self._pending = None
+        if self._var is None:
+            raise AttributeError("This form element does not have a variable.")
+        self._var.set(",".join(self.value))
+
+    def destroy(self):
+        """Cancel any pending selection update, then destroy the element."""
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        super().destroy()
 
     @property
     def value(self):
         """Get the selected choices."""
         if not hasattr(self, "listbox") or self.listbox is None:
             return []
-        return [self.listbox.get(i) for i in self.listbox.curselection()]
+        # The item text is already known in Python; only ask Tk for the indices
+        return [self._listbox_choices[i] for i in self.listbox.curselection()]
 
     @value.setter
     def value(self, new_value: list[str] | None):
@@ -463,63 +800,81 @@ class MultiChoiceForm(FormElement):
         if not hasattr(self, "listbox") or self.listbox is None:
             return
 
+        if self._var is None:
+            raise AttributeError("This form element does not have a variable.")
         self.listbox.select_clear(0, tk.END)
-        if new_value is not None:
-            for choice in new_value:
-                try:
-                    index = self.choices.index(choice)
-                    self.listbox.select_set(index)
-                except ValueError:
-                    # Ignore choices that don't exist
-                    pass
-        self._on_select(None)
-
+        # Test each choice against a set rather than searching self.choices per value;
+        # values that aren't choices, including unhashable ones, are ignored
+        wanted = {
+            value
+            for value in (new_value if new_value is not None else ())
+            if _in_choice_set(value, self._choice_set)
+        }
+        selected = []
+        for index, choice in enumerate(self._listbox_choices):
+            if choice in wanted:
+                self.listbox.select_set(index)
+                selected.append(choice)
+        # The items are already known here, so don't read them back from the listbox
+        self._var.set(",".join(selected))
 
-class FileForm(FormElement):
-    """Class for a file input form element."""
+    def add_choice(self, choice: str):
+        """Add a new choice to the multi-choice input."""
+        if choice not in self._choice_set:
+            self._choice_set.add(choice)
+            self.choices.append(choice)
+            self._listbox_choices.append(choice)
+            self.listbox.insert(tk.END, choice)
+        else:
+            raise ValueError(f"Choice '{choice}' already exists.")
 
-    def __init__(self, master: tk.Misc, name: str, default: str | None = None):
-        # Initialize the variable before calling super().__init__
-        self._var = tk.StringVar(value=default if default is not None else "")
-        super().__init__(master, name, default)
-        self.regen_widgets()
+    def remove_choice(self, choice: str):
+        """Remove a choice from the multi-choice input."""
+        if _in_choice_set(choice, self._choice_set):
+            self._choice_set.discard(choice)
+            # Look the index up in memory rather than enumerating the listbox
+            index = self.choices.index(choice)
+            del self.choices[index]
+            del self._listbox_choices[index]
+            self.listbox.delete(index)
+            self._on_select(None)
+        else:
+            raise ValueError(f"Choice '{choice}' does not exist.")
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the file input."""
-        for widget in self.winfo_children():
-            widget.destroy()
+    def clear_choices(self):
+        """Clear all choices from the multi-choice input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
+        self.choices.clear()
+        self._choice_set.clear()
+        self._listbox_choices.clear()
+        self.listbox.delete(0, tk.END)
+        self._var.set("")
+
+
+class FileForm(_EntryFormElement):
+    """Class for a file input form element."""
+
+    __slots__ = ("button",)
+
+    def _build_widgets(self):
+        """Build the widgets for the file input."""
+        super()._build_widgets()
         self.button = tk.Button(self, text="Browse", command=self.browse_file)
         self.button.pack(pady=5)
 
     def browse_file(self):
         """Open a file dialog to select a file."""
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename()
         if file_path and self._var is not None:
             self._var.set(file_path)
 
-    @property
-    def value(self):
-        """Get the file path value of the form element."""
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        return self._var.get()
-
-    @value.setter
-    def value(self, new_value: str | None):
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self._var.set(new_value if new_value is not None else "")
-        self.regen_widgets()
-
     def clear(self):
         """Clear the file input."""
         if self._var is not None:
             self._var.set("")
-        self.regen_widgets()
 
     def reset(self):
         """Reset the file input to its default state."""
@@ -529,60 +884,42 @@ class FileForm(FormElement):
 class DirectoryForm(FileForm):
     """Class for a directory input form element."""
 
-    def __init__(self, master: tk.Misc, name: str, default: str | None = None):
-        super().__init__(master, name, default)
+    __slots__ = ()
 
     def browse_file(self):
         """Open a directory dialog to select a directory."""
+        from tkinter import filedialog
+
         dir_path = filedialog.askdirectory()
         if dir_path and self._var is not None:
             self._var.set(dir_path)
 
 
-class PathForm(FormElement):
+class PathForm(_EntryFormElement):
     """Class for a path input form element."""
 
-    def __init__(self, master: tk.Misc, name: str, default: str | None = None):
-        # Initialize the variable before calling super().__init__
-        self._var = tk.StringVar(value=default if default is not None else "")
-        super().__init__(master, name, default)
-        self.regen_widgets()
+    __slots__ = ("button",)
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the path input."""
-        for widget in self.winfo_children():
-            widget.destroy()
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
+    def _build_widgets(self):
+        """Build the widgets for the path input."""
+        super()._build_widgets()
         self.button = tk.Button(self, text="Browse", command=self.browse_file)
         self.button.pack(pady=5)
 
     def browse_file(self):
         """Open a file dialog to select a file or directory."""
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename() or filedialog.askdirectory()
         if file_path and self._var is not None:
             self._var.set(file_path)
 
-    @property
-    def value(self):
-        """Get the path value of the form element."""
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        return self._var.get()
-
-    @value.setter
-    def value(self, new_value: str | None):
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self._var.set(new_value if new_value is not None else "")
-        self.regen_widgets()
 
-
-class RadioForm(FormElement):
+class RadioForm(_ChoiceFormElement):
     """Class for a radio button input form element."""
 
+    __slots__ = ("_var", "_rb_widgets")
+
     def __init__(
         self, master: tk.Misc, name: str, choices: list[str], default: str | None = None
     ):
@@ -592,33 +929,49 @@ class RadioForm(FormElement):
         value = default if default in choices else choices[0]
         self._var = tk.StringVar(value=value)
         self.choices = choices
+        # Mirror of self.choices for O(1) membership checks
+        self._choice_set: set[str] = set(choices)
         super().__init__(master, name, default)
         self.regen_widgets()
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the radio button input."""
-        for widget in self.winfo_children():
-            widget.destroy()
+    def _build_widgets(self):
+        """Build the widgets for the radio button input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
+        self._rb_widgets: dict[str, tk.Radiobutton] = {}
         for choice in self.choices:
-            rb = tk.Radiobutton(self, text=choice, variable=self._var, value=choice)
-            rb.pack(anchor=tk.W)
-
-    @property
-    def value(self):
-        """Get the selected radio button value."""
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        return self._var.get()
-
-    @value.setter
+            self._rb_widgets[choice] = self._make_radiobutton(choice)
+
+    def _refresh_widgets(self):
+        """Sync the radio buttons with the current choices."""
+        wanted = dict.fromkeys(self.choices)
+        self._choice_set = set(wanted)
+        for choice in [c for c in self._rb_widgets if c not in wanted]:
+            self._rb_widgets.pop(choice).destroy()
+        for choice in wanted:
+            if choice not in self._rb_widgets:
+                self._rb_widgets[choice] = self._make_radiobutton(choice)
+        if list(self._rb_widgets) != list(wanted):
+            # Choices were reordered; repack the buttons so they follow suit
+            for choice in wanted:
+                rb = self._rb_widgets.pop(choice)
+                rb.pack_forget()
+                rb.pack(anchor=tk.W)
+                self._rb_widgets[choice] = rb
+
+    def _make_radiobutton(self, choice: str) -> tk.Radiobutton:
+        """Create and pack the radio button for a single choice."""
+        rb = tk.Radiobutton(self, text=choice, variable=self._var, value=choice)
+        rb.pack(anchor=tk.W)
+        return rb
+
+    @FormElement.value.setter
     def value(self, new_value: str | None):
         """Set the selected radio button value."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
         # Handle new_value=None by setting to the first choice
-        if new_value in self.choices:
+        if _in_choice_set(new_value, self._choice_set):
             self._var.set(new_value)
         elif new_value is None and self.choices:
             self._var.set(self.choices[0])
@@ -629,9 +982,10 @@ class RadioForm(FormElement):
         """Add a new choice to the radio button input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        if choice not in self.choices:
+        if choice not in self._choice_set:
+            self._choice_set.add(choice)
             self.choices.append(choice)
-            self.regen_widgets()
+            self._rb_widgets[choice] = self._make_radiobutton(choice)
         else:
             raise ValueError(f"Choice '{choice}' already exists.")
 
@@ -639,13 +993,14 @@ class RadioForm(FormElement):
         """Remove a choice from the radio button input."""
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
-        if choice in self.choices:
+        if _in_choice_set(choice, self._choice_set):
+            self._choice_set.discard(choice)
             self.choices.remove(choice)
+            self._rb_widgets.pop(choice).destroy()
             if self.choices and self._var.get() == choice:
                 self._var.set(self.choices[0])
             elif not self.choices:
                 self._var.set("")
-            self.regen_widgets()
         else:
             raise ValueError(f"Choice '{choice}' does not exist.")
 
@@ -654,27 +1009,23 @@ class RadioForm(FormElement):
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
         self.choices.clear()
+        self._choice_set.clear()
+        for rb in self._rb_widgets.values():
+            rb.destroy()
+        self._rb_widgets.clear()
         self._var.set("")
-        self.regen_widgets()
 
 
-class ColorForm(FormElement):
+class ColorForm(_EntryFormElement):
     """Class for a color input form element."""
 
-    def __init__(self, master: tk.Misc, name: str, default: str | None = None):
-        # Initialize the variable before calling super().__init__
-        self._var = tk.StringVar(value=default if default is not None else "#FFFFFF")
-        super().__init__(master, name, default)
-        self.regen_widgets()
+    __slots__ = ("button",)
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the color input."""
-        for widget in self.winfo_children():
-            widget.destroy()
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self.entry = tk.Entry(self, textvariable=self._var)
-        self.entry.pack(fill=tk.X, padx=5, pady=5)
+    _empty_value = "#FFFFFF"
+
+    def _build_widgets(self):
+        """Build the widgets for the color input."""
+        super()._build_widgets()
         self.button = tk.Button(self, text="Select Color", command=self.select_color)
         self.button.pack(pady=5)
 
@@ -682,41 +1033,31 @@ class ColorForm(FormElement):
         """Open a color dialog to select a color."""
         if self._var is None:
             return
+        from tkinter import colorchooser
+
         color = colorchooser.askcolor(color=self._var.get())
         if color[1]:
             self._var.set(color[1])
 
-    @property
-    def value(self):
-        """Get the selected color value."""
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        return self._var.get()
-
-    @value.setter
-    def value(self, new_value: str | None):
-        if self._var is None:
-            raise AttributeError("This form element does not have a variable.")
-        self._var.set(new_value if new_value is not None else "#FFFFFF")
-        self.regen_widgets()
-
 
 class ColorPickerForm(ColorForm):
     """Class for a color picker input form element."""
 
+    __slots__ = ("color_display",)
+
     def __init__(self, master: tk.Misc, name: str, default: str | None = None):
         super().__init__(master, name, default)
-        # Note: self._var is already initialized by ColorForm's __init__
-        self.regen_widgets()
+        # Note: self._var and the widgets are already set up by ColorForm's __init__
+        # Register the trace once per element, not once per widget build
+        self._trace_write(self.update_color_display)
 
-    def regen_widgets(self):
-        """Regenerate the widgets for the color picker input."""
-        super().regen_widgets()
+    def _build_widgets(self):
+        """Build the widgets for the color picker input."""
+        super()._build_widgets()
         if self._var is None:
             raise AttributeError("This form element does not have a variable.")
         self.color_display = tk.Label(self, bg=self._var.get(), width=20, height=2)
         self.color_display.pack(pady=5)
-        self._var.trace_add("write", self.update_color_display)
 
     def update_color_display(self, *_):
         """Update the color display when the variable changes."""